@@ -46,8 +46,11 @@ export default function LenderDashboardPage() {
       setError(null)
 
       try {
-        // Fetch portfolio data
-        const portfolioResult = await fetchLenderPortfolio(user.email, user.email, activeRole)
+        // Fetch portfolio data and recent repayments in parallel
+        const [portfolioResult, repaymentsResult] = await Promise.all([
+          fetchLenderPortfolio(user.email, user.email, activeRole),
+          fetchLenderRepayments(user.email, user.email, activeRole, 10),
+        ])
 
         if (portfolioResult.error) {
           throw new Error(portfolioResult.error)
@@ -73,9 +76,6 @@ export default function LenderDashboardPage() {
           pendingInvitationsCount: pending.length,
         })
 
-        // Fetch recent repayments
-        const repaymentsResult = await fetchLenderRepayments(user.email, user.email, activeRole, 10)
-
         if (!repaymentsResult.error) {
           setRepayments(repaymentsResult.data || [])
         }
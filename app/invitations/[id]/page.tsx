@@ -67,17 +67,18 @@ export default function InvitationDetailPage({ params }: { params: Promise<{ id:
 
       setInvitation(invitationResult.data)
 
-      // Fetch loan details
-      const loanResult = await fetchLoanDetail(invitationResult.data.loan_id, user!.email, activeRole)
+      // Fetch loan and borrower details in parallel (the invitation carries borrower_id)
+      const [loanResult, borrowerResult] = await Promise.all([
+        fetchLoanDetail(invitationResult.data.loan_id, user!.email, activeRole),
+        fetchBorrowerInfo(invitationResult.data.borrower_id, user!.email, activeRole),
+      ])
 
       if (loanResult.data) {
         setLoan(loanResult.data)
+      }
 
-        // Fetch borrower details
-        const borrowerResult = await fetchBorrowerInfo(loanResult.data.borrower_id, user!.email, activeRole)
-        if (borrowerResult.data) {
-          setBorrower(borrowerResult.data)
-        }
+      if (borrowerResult.data) {
+        setBorrower(borrowerResult.data)
       }
 
       setIsLoading(false)
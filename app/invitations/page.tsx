@@ -7,7 +7,7 @@ import { Button } from "@/components/ui/button"
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { Skeleton } from "@/components/ui/skeleton"
 import { useUser } from "@/lib/user-context"
-import { fetchPendingInvitations, fetchLoanDetail, fetchBorrowerInfo } from "@/lib/api"
+import { fetchPendingInvitations, fetchLoansByIds, fetchBorrowersByIds } from "@/lib/api"
 import { formatCurrency, formatDate, formatPercentage } from "@/lib/utils"
 import { StatusBadge } from "@/components/status-badge"
 import { AlertCircle, ArrowRight, Mail, Inbox } from "lucide-react"
@@ -41,23 +41,21 @@ export default function InvitationsPage() {
         return
       }
 
-      // Fetch loan and borrower details for each invitation
-      const invitationsWithDetails = await Promise.all(
-        result.data.map(async (invitation) => {
-          const loanResult = await fetchLoanDetail(invitation.loan_id, user!.email, activeRole)
-          let borrowerResult = null
-
-          if (loanResult.data) {
-            borrowerResult = await fetchBorrowerInfo(loanResult.data.borrower_id, user!.email, activeRole)
-          }
-
-          return {
-            invitation,
-            loan: loanResult.data,
-            borrower: borrowerResult?.data || null,
-          }
-        }),
-      )
+      // Fetch loan and borrower details in two batched requests, in parallel
+      const loanIds = [...new Set(result.data.map((invitation) => invitation.loan_id))]
+      const borrowerIds = [...new Set(result.data.map((invitation) => invitation.borrower_id))]
+      const [loansResult, borrowersResult] = await Promise.all([
+        fetchLoansByIds(loanIds, user!.email, activeRole),
+        fetchBorrowersByIds(borrowerIds, user!.email, activeRole),
+      ])
+      const loansById = new Map((loansResult.data || []).map((loan) => [loan.id, loan]))
+      const borrowersById = new Map((borrowersResult.data || []).map((borrower) => [borrower.id, borrower]))
+
+      const invitationsWithDetails = result.data.map((invitation) => ({
+        invitation,
+        loan: loansById.get(invitation.loan_id) || null,
+        borrower: borrowersById.get(invitation.borrower_id) || null,
+      }))
 
       setInvitations(invitationsWithDetails)
       setIsLoading(false)
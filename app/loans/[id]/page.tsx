@@ -132,37 +132,38 @@ export default function LoanDetailPage() {
 
       // Fetch lenders (borrowers see all, lenders see only themselves)
       const lenderEmail = activeRole === "lender" ? user.email : undefined
-      const lendersResult = await fetchLoanLenders(loanId, user.email, activeRole, lenderEmail)
-      if (lendersResult.data) {
-        setLenders(lendersResult.data)
+      const lendersRequest = fetchLoanLenders(loanId, user.email, activeRole, lenderEmail)
 
-        // Check if lender has access
-        if (activeRole === "lender" && lendersResult.data.length === 0) {
+      // Check if lender has access before loading the rest of the loan
+      if (activeRole === "lender") {
+        const lenderAccessResult = await lendersRequest
+        if (lenderAccessResult.data && lenderAccessResult.data.length === 0) {
           setError("You don't have access to this loan")
           setIsLoading(false)
           return
         }
       }
 
-      // Fetch repayments
-      const repaymentsResult = await fetchLoanRepayments(
-        loanId,
-        user.email,
-        activeRole,
-        activeRole === "lender" ? user.email : undefined,
-      )
+      // Repayments, notifications and borrower info only depend on the loan, so fetch them in parallel
+      const [lendersResult, repaymentsResult, notificationsResult, borrowerResult] = await Promise.all([
+        lendersRequest,
+        fetchLoanRepayments(loanId, user.email, activeRole, lenderEmail),
+        fetchLoanNotifications(loanId, user.email, activeRole),
+        fetchBorrowerInfo(loanResult.data.borrower_id, user.email, activeRole),
+      ])
+
+      if (lendersResult.data) {
+        setLenders(lendersResult.data)
+      }
+
       if (repaymentsResult.data) {
         setRepayments(repaymentsResult.data)
       }
 
-      // Fetch notifications
-      const notificationsResult = await fetchLoanNotifications(loanId, user.email, activeRole)
       if (notificationsResult.data) {
         setNotifications(notificationsResult.data)
       }
 
-      // Fetch borrower info
-      const borrowerResult = await fetchBorrowerInfo(loanResult.data.borrower_id, user.email, activeRole)
       if (borrowerResult.data) {
         setBorrowerInfo(borrowerResult.data)
       }
@@ -62,14 +62,15 @@ export default function SubmitPaymentPage() {
     setIsLoading(true)
 
     try {
-      // Fetch loan details
-      const loanResult = await fetchLoanDetail(loanId, user.email, activeRole)
+      // Fetch loan details and available lenders in parallel
+      const [loanResult, lendersResult] = await Promise.all([
+        fetchLoanDetail(loanId, user.email, activeRole),
+        fetchAvailableLenders(loanId, user.email, activeRole),
+      ])
       if (loanResult.data) {
         setLoan(loanResult.data)
       }
 
-      // Fetch available lenders
-      const lendersResult = await fetchAvailableLenders(loanId, user.email, activeRole)
       if (lendersResult.data) {
         setLendersData(lendersResult.data)
       }
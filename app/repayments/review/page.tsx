@@ -5,11 +5,11 @@ import { useRouter } from "next/navigation"
 import { useUser } from "@/lib/user-context"
 import {
   fetchPendingRepayments,
-  fetchLoanDetailsForRepayment,
-  fetchBorrowerDetailsForRepayment,
+  fetchLoansByIds,
+  fetchBorrowersByIds,
   reviewRepayment,
 } from "@/lib/api"
-import type { EnrichedRepayment, Repayment } from "@/lib/types"
+import type { EnrichedRepayment, LoanDetailsForRepayment, Repayment } from "@/lib/types"
 import { formatCurrency, formatDate, formatRelativeTime } from "@/lib/utils"
 import { Button } from "@/components/ui/button"
 import { Badge } from "@/components/ui/badge"
@@ -114,31 +114,25 @@ export default function ReviewRepaymentsPage() {
     const loanIds = [...new Set(repayments.map((r) => r.loan_id))]
     const borrowerIds = [...new Set(repayments.map((r) => r.borrower_id))]
 
-    // Fetch data in parallel
-    const [loansResults, borrowersResults] = await Promise.all([
-      Promise.all(loanIds.map((loanId) => fetchLoanDetailsForRepayment(loanId, user.email, activeRole))),
-      Promise.all(
-        borrowerIds.map((borrowerId) => fetchBorrowerDetailsForRepayment(borrowerId, user.email, activeRole)),
-      ),
+    // Fetch loans and borrowers in two batched requests, in parallel
+    const [loansResult, borrowersResult] = await Promise.all([
+      fetchLoansByIds<LoanDetailsForRepayment>(loanIds, user.email, activeRole, "id,loan_name,borrower_id"),
+      fetchBorrowersByIds(borrowerIds, user.email, activeRole),
     ])
 
     // Create lookup maps
     const loansMap: Record<string, { loan_name: string }> = {}
-    loansResults.forEach((result) => {
-      if (result.data) {
-        loansMap[result.data.id] = { loan_name: result.data.loan_name }
-      }
-    })
+    for (const loan of loansResult.data || []) {
+      loansMap[loan.id] = { loan_name: loan.loan_name }
+    }
 
     const borrowersMap: Record<string, { full_name: string; email: string }> = {}
-    borrowersResults.forEach((result) => {
-      if (result.data) {
-        borrowersMap[result.data.id] = {
-          full_name: result.data.full_name,
-          email: result.data.email,
-        }
+    for (const borrower of borrowersResult.data || []) {
+      borrowersMap[borrower.id] = {
+        full_name: borrower.full_name,
+        email: borrower.email,
       }
-    })
+    }
 
     // Enrich repayments
     return repayments.map((repayment) => ({
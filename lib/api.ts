@@ -60,6 +60,40 @@ async function apiCall<T>(
   }
 }
 
+// PostgREST id=in.(...) lists are split into chunks of this many ids so the
+// query string stays well under proxy/PostgREST URL length limits
+const ID_BATCH_SIZE = 100
+
+// Helper function to fetch rows of a table by id in batched `id=in.(...)` requests.
+// Chunks run in parallel; rows from successful chunks are returned even if another chunk fails.
+async function apiCallByIds<T>(
+  table: string,
+  ids: string[],
+  select: string,
+  userEmail: string,
+  activeRole: string,
+): Promise<ApiResponse<T[]>> {
+  if (ids.length === 0) {
+    return { data: [], error: null }
+  }
+
+  const chunks: string[][] = []
+  for (let i = 0; i < ids.length; i += ID_BATCH_SIZE) {
+    chunks.push(ids.slice(i, i + ID_BATCH_SIZE))
+  }
+
+  const results = await Promise.all(
+    chunks.map((chunk) =>
+      apiCall<T[]>(`/${table}?id=in.(${chunk.join(",")})&select=${select}`, {}, userEmail, activeRole),
+    ),
+  )
+
+  const data = results.flatMap((result) => result.data || [])
+  const failed = results.find((result) => result.error)
+
+  return { data, error: failed ? failed.error : null }
+}
+
 // Fetch user's available roles
 // If currentRole is null/undefined, backend will default to user's primary_role
 export async function fetchUserRoles(userEmail: string, currentRole?: string | null): Promise<ApiResponse<UserRolesData>> {
@@ -345,6 +379,25 @@ export async function fetchBorrowerInfo(
   return { data: result.data[0], error: null }
 }
 
+// Batch variants of fetchLoanDetail / fetchBorrowerInfo: one request per 100 ids
+// instead of one request per id
+export async function fetchLoansByIds<T = LoanDetail>(
+  loanIds: string[],
+  userEmail: string,
+  activeRole: string,
+  select = "*",
+): Promise<ApiResponse<T[]>> {
+  return apiCallByIds<T>("loans", loanIds, select, userEmail, activeRole)
+}
+
+export async function fetchBorrowersByIds(
+  borrowerIds: string[],
+  userEmail: string,
+  activeRole: string,
+): Promise<ApiResponse<BorrowerInfo[]>> {
+  return apiCallByIds<BorrowerInfo>("users", borrowerIds, "id,full_name,email", userEmail, activeRole)
+}
+
 export async function revokeLenderInvitation(
   loanLenderId: string,
   userEmail: string,
@@ -559,44 +612,6 @@ export async function fetchPendingRepayments(
   )
 }
 
-export async function fetchLoanDetailsForRepayment(
-  loanId: string,
-  userEmail: string,
-  activeRole: string,
-): Promise<ApiResponse<{ id: string; loan_name: string; borrower_id: string }>> {
-  const result = await apiCall<{ id: string; loan_name: string; borrower_id: string }[]>(
-    `/loans?id=eq.${loanId}&select=id,loan_name,borrower_id`,
-    {},
-    userEmail,
-    activeRole,
-  )
-
-  if (result.error || !result.data || result.data.length === 0) {
-    return { data: null, error: result.error || "Loan not found" }
-  }
-
-  return { data: result.data[0], error: null }
-}
-
-export async function fetchBorrowerDetailsForRepayment(
-  borrowerId: string,
-  userEmail: string,
-  activeRole: string,
-): Promise<ApiResponse<{ id: string; full_name: string; email: string }>> {
-  const result = await apiCall<{ id: string; full_name: string; email: string }[]>(
-    `/users?id=eq.${borrowerId}&select=id,full_name,email`,
-    {},
-    userEmail,
-    activeRole,
-  )
-
-  if (result.error || !result.data || result.data.length === 0) {
-    return { data: null, error: result.error || "Borrower not found" }
-  }
-
-  return { data: result.data[0], error: null }
-}
-
 export async function reviewRepayment(
   repaymentId: string,
   reviewData: {
@@ -322,12 +322,6 @@ export interface LoanDetailsForRepayment {
   borrower_id: string
 }
 
-export interface BorrowerDetailsForRepayment {
-  id: string
-  full_name: string
-  email: string
-}
-
 export interface ReviewRepaymentRequest {
   status: "approved" | "rejected"
   reviewed_by: string